@@ -2,10 +2,32 @@ import os
 import sys
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
-@dataclass
+_SEP = os.sep
+_SEPS = os.sep + (os.altsep or '')  # Separators that may already end a parent path
+
+def _split_path(path: str) -> list:
+    """
+    Split a relative path into its components on both os.sep and os.altsep.
+    """
+    if os.altsep:
+        path = path.replace(os.altsep, _SEP)
+    return path.split(_SEP)
+
+def _to_key(name: str) -> str:
+    """
+    Convert a file or folder name to its attribute key (spaces and '.' become '_').
+
+    Two chained str.replace calls are used rather than str.translate: for the
+    short ASCII names seen here, translate is several times slower in CPython.
+    The scan loops inline the same expression to avoid the function call.
+    """
+    return name.replace(' ', '_').replace('.', '_')
+
+@dataclass(slots=True)
 class Folder:
     """
     A class to represent a folder in the filesystem and manage subfolders and files.
@@ -18,13 +40,18 @@ class Folder:
         The path of the parent folder.
     subfolders : dict
         A dictionary of subfolder names (keys) and Folder objects (values).
+        Keys have spaces and '.' replaced with '_'. In lazily loaded folders, a
+        subfolder that has not been accessed yet is stored as its name (str).
     files : dict
         A dictionary of file names (keys) and their paths (values).
+        Keys have spaces and '.' replaced with '_'.
 
     Methods
     -------
     __getattr__(item)
-        Allows access to subfolders and files as attributes. Replaces '_' with spaces.
+        Allows access to subfolders and files as attributes. Spaces and '.' in names become '_'.
+    __dir__()
+        Lists subfolders and files alongside the regular attributes (for tab completion).
     dir()
         Returns the full path to this folder.
     ls()
@@ -41,6 +68,18 @@ class Folder:
     parent_path: str = ""  # Track the parent folder path for constructing full paths
     subfolders: Dict[str, Any] = field(default_factory=dict)
     files: Dict[str, str] = field(default_factory=dict)
+    _loaded: bool = field(default=False, init=False, repr=False, compare=False)  # Whether the contents have been scanned from disk
+    _full_path: str = field(default="", init=False, repr=False, compare=False)  # Cached result of dir()
+
+    def __post_init__(self):
+        # Same result as os.path.join(parent_path, name) for a parent and a plain name
+        parent = self.parent_path
+        if not parent:
+            self._full_path = self.name
+        elif parent[-1] in _SEPS:
+            self._full_path = parent + self.name
+        else:
+            self._full_path = parent + _SEP + self.name
 
     def __getattr__(self, item):
         """
@@ -49,7 +88,7 @@ class Folder:
         Parameters
         ----------
         item : str
-            The name of the folder or file, replacing spaces with underscores.
+            The name of the folder or file, with spaces and '.' replaced by underscores.
 
         Returns
         -------
@@ -71,14 +110,44 @@ class Folder:
         >>> folder.file1
         '/path/to/file1'
         """
-        folder_name = item.replace('_', ' ')
-        if folder_name in self.subfolders:
-            return self.subfolders[folder_name]
-        elif item in self.subfolders:
-            return self.subfolders[item]
-        if item in self.files:
-            return self.files[item]
-        raise AttributeError(f"'{item}' not found in folder '{self.name}'")
+        # Unset fields on a half-initialized instance (copy, pickle) are never
+        # folder contents; looking further would recurse through __getattr__.
+        if item in Folder.__slots__:
+            raise AttributeError(item)
+        # Dunder probes (copy, pickle, IPython, ...) do not trigger a scan, but
+        # already-loaded entries such as __pycache__ are still returned.
+        if not (item.startswith('__') and item.endswith('__')):
+            try:
+                self._ensure_loaded()
+            except OSError as e:  # e.g. PermissionError; hasattr/getattr only expect AttributeError
+                raise AttributeError(f"'{item}' not found in folder '{self.name}': {e}") from e
+        value = self.subfolders.get(item)
+        if value is not None:
+            if type(value) is str:
+                value = self._subfolder(item)
+        else:
+            value = self.files.get(item)
+            if value is None:
+                raise AttributeError(f"'{item}' not found in folder '{self.name}'")
+        return value
+
+    def __dir__(self):
+        """
+        List the attributes of the folder, including its subfolders and files.
+
+        This lets tab completion offer folder contents without probing
+        `__getattr__` name by name.
+
+        Returns
+        -------
+        list of str
+            The regular attributes followed by the subfolder and file keys.
+        """
+        try:
+            self._ensure_loaded()
+        except OSError:  # Unreadable folder: list only what is already known
+            pass
+        return object.__dir__(self) + list(self.subfolders) + list(self.files)
 
     def dir(self):
         """
@@ -95,7 +164,64 @@ class Folder:
         >>> folder.dir()
         '/home/user/root'
         """
-        return os.path.join(self.parent_path, self.name)
+        return self._full_path
+
+    def _scan(self, placeholders=False):
+        """
+        Scan this folder's directory (one level) into `subfolders` and `files`.
+
+        Subfolders are created unloaded; existing entries are kept. Symlinks are
+        not followed, so every entry that is not a real directory is a file.
+
+        Parameters
+        ----------
+        placeholders : bool, optional
+            Whether to store subfolders as their names and defer creating the
+            Folder objects until first access. Default is False.
+        """
+        path = self._full_path  # Shared by every child as its parent_path
+        sub_pairs = []
+        file_pairs = []
+        # Bound methods are hoisted out of the per-entry loop.
+        add_sub = sub_pairs.append
+        add_file = file_pairs.append
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    add_sub((name.replace(' ', '_').replace('.', '_'), name if placeholders else Folder(name, path)))
+                else:
+                    add_file((name.replace(' ', '_').replace('.', '_'), entry.path))
+        subfolders = self.subfolders
+        if subfolders:
+            sub_pairs = [pair for pair in sub_pairs if pair[0] not in subfolders]
+        subfolders.update(sub_pairs)
+        self.files.update(file_pairs)
+        self._loaded = True
+
+    def _ensure_loaded(self):
+        """
+        Load the contents of this folder from the filesystem on first use.
+
+        A folder whose path does not exist or is not a directory loads as empty.
+        Other OSErrors (e.g. PermissionError) propagate and the folder stays
+        unloaded so the scan is retried on the next access.
+        """
+        if not self._loaded:
+            try:
+                self._scan(placeholders=True)
+            except (FileNotFoundError, NotADirectoryError):
+                self._loaded = True
+
+    def _subfolder(self, key):
+        """
+        Return the subfolder stored under `key`, creating its Folder if it is a placeholder.
+        """
+        value = self.subfolders[key]
+        if type(value) is str:
+            value = Folder(value, self._full_path)
+            self.subfolders[key] = value
+        return value
 
     def ls(self):
         """
@@ -115,20 +241,13 @@ class Folder:
         Files:
           [File] file1
         """
-        print(f"Contents of '{self.dir()}':")
-        if self.subfolders:
-            print("Subfolders:")
-            for subfolder in self.subfolders:
-                print(f"  [Dir] {subfolder}")
-        else:
-            print("No subfolders.")
-        
-        if self.files:
-            print("Files:")
-            for file in self.files:
-                print(f"  [File] {file}")
-        else:
-            print("No files.")
+        self._ensure_loaded()
+        lines = [f"Contents of '{self.dir()}':"]
+        lines.append("Subfolders:" if self.subfolders else "No subfolders.")
+        lines.extend(f"  [Dir] {subfolder}" for subfolder in self.subfolders)
+        lines.append("Files:" if self.files else "No files.")
+        lines.extend(f"  [File] {file}" for file in self.files)
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def remove(self, name: str):
         """
@@ -137,7 +256,8 @@ class Folder:
         Parameters
         ----------
         name : str
-            The name of the file or folder to remove, replacing underscores with spaces if needed.
+            The name of the file or folder to remove, as used for attribute access
+            (spaces and '.' replaced by underscores).
 
         Examples
         --------
@@ -149,21 +269,28 @@ class Folder:
         >>> folder.remove('file1')
         File 'file1' has been removed from '/root'
         """
-        clean_name_with_spaces = name.replace('_', ' ')
-        clean_name_with_underscores = name.replace(' ', '_')
-        
-        if clean_name_with_underscores in self.subfolders:
-            full_path = os.path.join(self.dir(), self.subfolders[clean_name_with_underscores].name)
-            shutil.rmtree(full_path)
-            del self.subfolders[clean_name_with_underscores]
-            print(f"Subfolder '{clean_name_with_spaces}' has been removed from '{self.dir()}'")
-        elif clean_name_with_underscores in self.files:
-            full_path = self.files[clean_name_with_underscores]
+        self._ensure_loaded()
+        if name in self.subfolders:
+            target = self._subfolder(name)
+            full_path = target._full_path
+            if target._loaded and not target.subfolders and not target.files:
+                try:
+                    os.rmdir(full_path)
+                except OSError:  # Contents changed on disk since the folder was loaded
+                    shutil.rmtree(full_path)
+            else:
+                shutil.rmtree(full_path)
+            target.subfolders.clear()
+            target.files.clear()
+            del self.subfolders[name]
+            print(f"Subfolder '{name}' has been removed from '{self.dir()}'")
+        elif name in self.files:
+            full_path = self.files[name]
             os.remove(full_path)
-            del self.files[clean_name_with_underscores]
-            print(f"File '{clean_name_with_spaces}' has been removed from '{self.dir()}'")
+            del self.files[name]
+            print(f"File '{name}' has been removed from '{self.dir()}'")
         else:
-            print(f"'{clean_name_with_spaces}' not found in '{self.dir()}'")
+            print(f"'{name}' not found in '{self.dir()}'")
 
     def mkdir(self, *args):
         """
@@ -181,19 +308,19 @@ class Folder:
         >>> folder.subfolders['new_subfolder']
         Folder(name='new_subfolder', parent_path='/root', subfolders={}, files={})
         """
-        full_path = os.path.join(self.dir(), *args)
+        self._ensure_loaded()
+        full_path = os.path.join(self._full_path, *args)
         os.makedirs(full_path, exist_ok=True)
 
-        relative_path = os.path.relpath(full_path, self.dir())
-        path_parts = relative_path.split(os.sep)
-
         current_folder = self
-        for part in path_parts:
-            clean_part = part.replace(' ', '_')
+        for part in (p for arg in args for p in _split_path(arg)):
+            if part in ('', '.'):
+                continue
+            clean_part = _to_key(part)
             if clean_part not in current_folder.subfolders:
-                new_folder = Folder(part, parent_path=current_folder.dir())
+                new_folder = Folder(part, parent_path=current_folder._full_path)
                 current_folder.subfolders[clean_part] = new_folder
-            current_folder = current_folder.subfolders[clean_part]
+            current_folder = current_folder._subfolder(clean_part)
         print(f"Created directory '{full_path}'")
     
     def chdir(self):
@@ -473,7 +600,7 @@ class Shortcut:
 
 class PathNavigator(Folder):
     """
-    A class to manage the root folder and recursively load its nested structure (subfolders and files).
+    A class to manage the root folder and load its nested structure (subfolders and files).
     
     
     dir()
@@ -489,6 +616,8 @@ class PathNavigator(Folder):
     -------
     reload()
         Reloads the entire folder structure from the filesystem.
+    batch(roots)
+        Creates PathNavigators for several roots, sharing the scan of nested roots.
         
     Examples
     --------
@@ -500,7 +629,7 @@ class PathNavigator(Folder):
     >>> pm.remove('folder1')    # removes a file or subfolder from the folder and deletes it from the filesystem.
     """
     
-    def __init__(self, root_dir: str, load_nested_directories=True):
+    def __init__(self, root_dir: str, load_nested_directories=True, max_workers=None, lazy=False):
         """
         Initialize the PathNavigator with the root directory and create a Shortcut manager.
 
@@ -510,42 +639,191 @@ class PathNavigator(Folder):
             The root directory to manage.
         load_nested_directories : bool, optional
             Whether to load nested directories and files from the filesystem. Default is True.
+        max_workers : int, optional
+            The number of threads used to scan directories while loading. Values
+            greater than 1 overlap filesystem calls, which helps on network
+            filesystems or cold caches. Default is None (serial loading).
+        lazy : bool, optional
+            Whether to defer scanning each folder until its contents are first
+            accessed instead of walking the whole tree up front. Default is False.
         """
         self.root = root_dir
+        self._max_workers = max_workers
+        self._lazy = lazy
         self.shortcuts = Shortcut()  # Initialize Shortcut manager as an attribute
         super().__init__(name=os.path.basename(self.root), parent_path=os.path.dirname(self.root))
-        if load_nested_directories:
-            self._load_nested_directories(self.root, self)
+        if not load_nested_directories:
+            self._loaded = True
+        elif not lazy:
+            self._load_nested_directories(self)
 
-    def _load_nested_directories(self, current_path: str, current_folder: Folder):
+    def _load_nested_directories(self, current_folder: Folder):
         """
-        Recursively load subfolders and files from the filesystem into the internal structure.
+        Load subfolders and files from the filesystem into the internal structure.
+
+        The tree is walked iteratively with an explicit stack rather than by recursion.
 
         Parameters
         ----------
-        current_path : str
-            The current path to load.
         current_folder : Folder
-            The Folder object representing the current directory.
-        """
-        for entry in os.scandir(current_path):
-            if entry.is_dir():
-                folder_name = entry.name
-                clean_name = folder_name.replace(' ', '_')
-                new_subfolder = Folder(folder_name, parent_path=current_path)
-                current_folder.subfolders[clean_name] = new_subfolder
-                self._load_nested_directories(entry.path, new_subfolder)
-            elif entry.is_file():
-                file_name = entry.name.replace('.', '_').replace(" ", "_")
-                current_folder.files[file_name] = entry.path
-    
+            The Folder object representing the starting directory.
+        """
+        if self._max_workers is not None and self._max_workers > 1:
+            self._load_nested_directories_threaded(current_folder)
+            return
+
+        stack = [current_folder]
+        while stack:
+            folder = stack.pop()
+            folder._scan()
+            stack.extend(folder.subfolders.values())
+
+    @staticmethod
+    def _scan_one(path: str):
+        """
+        Scan a single directory without touching any Folder objects.
+
+        Parameters
+        ----------
+        path : str
+            The directory to scan.
+
+        Returns
+        -------
+        tuple of list
+            The (name, path) pairs of the subdirectories and of the files in `path`.
+        """
+        dirs = []
+        files = []
+        add_dir = dirs.append
+        add_file = files.append
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    add_dir((entry.name, entry.path))
+                else:
+                    add_file((entry.name, entry.path))
+        return dirs, files
+
+    def _load_nested_directories_threaded(self, current_folder: Folder):
+        """
+        Load subfolders and files using a thread pool to scan directories concurrently.
+
+        Directory scans run in worker threads; their results are merged into the
+        Folder objects serially in the calling thread.
+
+        Parameters
+        ----------
+        current_folder : Folder
+            The Folder object representing the starting directory.
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending = {executor.submit(self._scan_one, current_folder.dir()): current_folder}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder = pending.pop(future)
+                    dirs, files = future.result()
+                    path = folder._full_path  # Shared by every child as its parent_path
+                    sub_pairs = []
+                    for folder_name, dir_path in dirs:
+                        clean_name = folder_name.replace(' ', '_').replace('.', '_')
+                        new_subfolder = Folder(folder_name, parent_path=path)
+                        sub_pairs.append((clean_name, new_subfolder))
+                        pending[executor.submit(self._scan_one, dir_path)] = new_subfolder
+                    folder.subfolders.update(sub_pairs)
+                    folder.files.update(
+                        [(file_name.replace(' ', '_').replace('.', '_'), file_path) for file_name, file_path in files]
+                    )
+                    folder._loaded = True
+
     def reload(self):
         """
         Reload the entire folder structure from the root directory.
 
+        With `lazy=True`, the cached structure is discarded and folders are
+        rescanned on their next access.
+
         Examples
         --------
         >>> pm = PathNavigator('/path/to/root')
         >>> pm.reload()
         """
-        self._load_nested_directories(self.root, self)
+        # Rebind rather than clear: the old dicts may be shared with another
+        # PathNavigator created by batch().
+        self.subfolders = {}
+        self.files = {}
+        if self._lazy:
+            self._loaded = False
+        else:
+            self._load_nested_directories(self)
+
+    @classmethod
+    def batch(cls, roots, max_workers=None, lazy=False):
+        """
+        Create a PathNavigator for each root, scanning shared subtrees only once.
+
+        A root that lies inside another root in `roots` reuses the folder structure
+        already loaded for the outer root instead of walking the filesystem again.
+        Its PathNavigator takes over that subfolder's state and replaces it in the
+        outer tree, so both navigators see the same, single folder object.
+
+        Parameters
+        ----------
+        roots : list of str
+            The root directories to manage.
+        max_workers : int, optional
+            The number of threads used to scan directories while loading. Default is None.
+        lazy : bool, optional
+            Whether to defer scanning each folder until first access. Default is False.
+
+        Returns
+        -------
+        list of PathNavigator
+            One PathNavigator per root, in the same order as `roots`.
+
+        Examples
+        --------
+        >>> project, data = PathNavigator.batch(['/path/to/project', '/path/to/project/data'])
+        >>> data.dir()
+        '/path/to/project/data'
+        """
+        abs_roots = [os.path.abspath(root) for root in roots]
+        navigators = [None] * len(roots)
+        loaded = []  # (absolute root, PathNavigator) for roots scanned from disk
+        for i in sorted(range(len(roots)), key=lambda i: len(abs_roots[i])):
+            abs_root = abs_roots[i]
+            for outer_root, outer in loaded:
+                if os.path.commonpath([outer_root, abs_root]) != outer_root:
+                    continue
+                parent, key, folder = None, None, outer
+                for part in os.path.relpath(abs_root, outer_root).split(os.sep):
+                    if part == '.':
+                        continue
+                    try:
+                        folder._ensure_loaded()
+                    except OSError:
+                        folder = None
+                        break
+                    key = _to_key(part)
+                    child = folder.subfolders.get(key)
+                    # Keys are lossy ('a b' and 'a_b' collide), so match the real name
+                    if child is None or (child if type(child) is str else child.name) != part:
+                        folder = None
+                        break
+                    parent, folder = folder, folder._subfolder(key)
+                if folder is None:
+                    continue
+                if parent is None:  # Same directory as the outer root
+                    navigators[i] = folder
+                else:
+                    navigator = cls(roots[i], load_nested_directories=False, max_workers=max_workers, lazy=lazy)
+                    for name in Folder.__slots__:
+                        setattr(navigator, name, getattr(folder, name))
+                    parent.subfolders[key] = navigator
+                    navigators[i] = navigator
+                break
+            if navigators[i] is None:
+                navigators[i] = cls(roots[i], max_workers=max_workers, lazy=lazy)
+                loaded.append((abs_root, navigators[i]))
+        return navigators
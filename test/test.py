@@ -1,6 +1,9 @@
 import os
+import sys
+import copy
 import shutil
-from pathnavigator.pathnavigator import Folder, PathNavigator  # Replace with your actual module name
+from unittest import mock
+from pathnavigator.pathnavigator import Folder, PathNavigator, _split_path  # Replace with your actual module name
 
 def test_folder_class():
     print("Testing Folder class...")
@@ -23,16 +26,57 @@ def test_folder_class():
     assert root_folder.subfolder1.name == "subfolder1", "__getattr__ method failed."
     print("__getattr__() passed.")
 
+    # Test repeated misses keep raising and entries added directly are found
+    for _ in range(3):
+        assert not hasattr(root_folder, "added_later"), "Missing attribute lookup failed."
+    root_folder.subfolders["added_later"] = Folder("added_later", parent_path=temp_root)
+    assert root_folder.added_later.name == "added_later", "Lookup after a miss failed."
+    del root_folder.subfolders["added_later"]
+    print("Missing attribute lookup passed.")
+
+    # Test scanning a folder does not change equality
+    unscanned, scanned = Folder("subfolder1", parent_path=temp_root), Folder("subfolder1", parent_path=temp_root)
+    assert not hasattr(scanned, "nope")
+    assert unscanned == scanned, "Scanning changed Folder equality."
+    print("Folder equality passed.")
+
+    # Test __dir__
+    assert "subfolder1" in dir(root_folder), "__dir__ method failed."
+    print("__dir__() passed.")
+
+    # Test copying does not recurse through __getattr__
+    copied_folder = copy.deepcopy(root_folder)
+    assert copied_folder.subfolder1.dir() == root_folder.subfolder1.dir(), "deepcopy failed."
+    print("deepcopy passed.")
+
     # Create another subfolder and test
     root_folder.mkdir("subfolder1", "nested_subfolder")
     assert "nested_subfolder" in root_folder.subfolder1.subfolders, "Nested subfolder creation failed."
     print("Nested mkdir() passed.")
 
+    # Create nested subfolders from a single path argument
+    root_folder.mkdir(os.path.join("subfolder2", "nested_subfolder"))
+    assert "nested_subfolder" in root_folder.subfolder2.subfolders, "Nested path mkdir failed."
+    other_sep = "\\" if os.sep == "/" else "/"
+    with mock.patch("os.altsep", other_sep):
+        assert _split_path(f"a{other_sep}b{os.sep}c") == ["a", "b", "c"], "Path split on os.altsep failed."
+    print("Nested path mkdir() passed.")
+
     # Test ls
     print("ls() test output:")
     root_folder.ls()  # Expecting the created subfolders to be printed
     print("ls() passed.")
 
+    # Test add_to_sys_path re-adds a path removed behind its back
+    sys_path_before = list(sys.path)
+    root_folder.add_to_sys_path(method='append')
+    sys.path.remove(root_folder.dir())
+    sys.path.append("/nonexistent_sys_path_entry")
+    root_folder.add_to_sys_path(method='append')
+    assert root_folder.dir() in sys.path, "add_to_sys_path() failed to re-add path."
+    sys.path[:] = sys_path_before
+    print("add_to_sys_path() passed.")
+
     # Test file creation (manually for now)
     test_file_path = os.path.join(temp_root, "test_file.txt")
     with open(test_file_path, "w") as f:
@@ -52,6 +96,35 @@ def test_folder_class():
     assert "nested_subfolder" not in root_folder.subfolder1.subfolders, "Subfolder deletion failed."
     print("Subfolder remove() passed.")
 
+    # Test remove of a loaded, empty subfolder uses os.rmdir only
+    root_folder.mkdir("empty_subfolder")
+    root_folder.empty_subfolder.ls()  # Load it
+    with mock.patch("shutil.rmtree", side_effect=AssertionError("rmtree called")):
+        root_folder.remove("empty_subfolder")
+    assert not os.path.exists(os.path.join(temp_root, "empty_subfolder")), "Empty subfolder deletion failed."
+    print("Empty subfolder remove() passed.")
+
+    # Test remove falls back to rmtree when a file appeared after loading
+    root_folder.mkdir("stale_subfolder")
+    stale = root_folder.stale_subfolder
+    stale.ls()  # Load it while still empty
+    with open(os.path.join(stale.dir(), "late_file.txt"), "w") as f:
+        f.write("Created after loading.")
+    root_folder.remove("stale_subfolder")
+    assert not os.path.exists(stale.dir()), "Stale subfolder deletion failed."
+    print("Stale subfolder remove() passed.")
+
+    # Test remove clears the removed folder's in-memory contents
+    root_folder.mkdir("full_subfolder", "inner")
+    full = root_folder.full_subfolder
+    with open(os.path.join(full.dir(), "file.txt"), "w") as f:
+        f.write("Test file content.")
+    full.files["file_txt"] = os.path.join(full.dir(), "file.txt")
+    root_folder.remove("full_subfolder")
+    assert not os.path.exists(full.dir()), "Full subfolder deletion failed."
+    assert not full.subfolders and not full.files, "Removed folder contents were not cleared."
+    print("Full subfolder remove() passed.")
+
     # Cleanup
     shutil.rmtree(temp_root)
     print("Folder tests completed successfully.\n")
@@ -86,6 +159,54 @@ def test_path_navigator():
     assert "test_file_txt" in manager.subfolder1.files, "File load failed."
     print("File access passed.")
 
+    # Test dunder-named directories are reachable as attributes
+    os.makedirs(os.path.join(temp_root, "__pycache__"), exist_ok=True)
+    assert PathNavigator(temp_root).__pycache__.name == "__pycache__", "Dunder-named folder access failed."
+    os.rmdir(os.path.join(temp_root, "__pycache__"))
+    print("Dunder-named folder access passed.")
+
+    # Test threaded load
+    threaded_manager = PathNavigator(temp_root, max_workers=4)
+    assert "nested_subfolder" in threaded_manager.subfolder1.subfolders, "Threaded load failed."
+    assert "test_file_txt" in threaded_manager.subfolder1.files, "Threaded file load failed."
+    os.makedirs(os.path.join(temp_root, "max_workers"), exist_ok=True)
+    assert isinstance(PathNavigator(temp_root, max_workers=4).max_workers, Folder), "Folder named max_workers is hidden."
+    os.rmdir(os.path.join(temp_root, "max_workers"))
+    print("Threaded load passed.")
+
+    # Test lazy load
+    lazy_manager = PathNavigator(temp_root, lazy=True)
+    assert not lazy_manager.subfolders, "Lazy load scanned eagerly."
+    assert lazy_manager.subfolder1.test_file_txt == test_file_path, "Lazy load failed."
+    assert lazy_manager.subfolder1.subfolders["nested_subfolder"] == "nested_subfolder", "Lazy placeholder missing."
+    assert lazy_manager.subfolder1.nested_subfolder.dir() == os.path.join(temp_root, "subfolder1", "nested_subfolder"), "Lazy placeholder access failed."
+    assert not hasattr(Folder("test_file.txt", parent_path=os.path.join(temp_root, "subfolder1")), "zz"), "Folder on a file path failed."
+    os.makedirs(os.path.join(temp_root, "lazy"), exist_ok=True)
+    assert isinstance(PathNavigator(temp_root, lazy=True).lazy, Folder), "Folder named lazy is hidden."
+    os.rmdir(os.path.join(temp_root, "lazy"))
+    print("Lazy load passed.")
+
+    # Test batch load of nested roots
+    outer, inner = PathNavigator.batch([temp_root, os.path.join(temp_root, "subfolder1")])
+    assert inner is outer.subfolder1, "Batch did not share the scanned tree."
+    assert inner.test_file_txt == test_file_path, "Batch file access failed."
+    assert not hasattr(inner, "made_by_outer"), "Batch lookup failed."
+    outer.subfolder1.mkdir("made_by_outer")
+    assert inner.made_by_outer.name == "made_by_outer", "Batch navigators went out of sync."
+    inner.remove("made_by_outer")
+    lazy_outer, lazy_inner = PathNavigator.batch([temp_root, os.path.join(temp_root, "subfolder1")], lazy=True)
+    assert lazy_inner is lazy_outer.subfolder1, "Lazy batch did not share the scanned tree."
+
+    # Test batch matches real names when attribute keys collide
+    os.makedirs(os.path.join(temp_root, "a b", "in_a_space_b"))
+    os.makedirs(os.path.join(temp_root, "a_b", "in_a_underscore_b"))
+    for lazy in (False, True):
+        _, spaced = PathNavigator.batch([temp_root, os.path.join(temp_root, "a b")], lazy=lazy)
+        assert hasattr(spaced, "in_a_space_b") and not hasattr(spaced, "in_a_underscore_b"), "Batch picked the wrong folder."
+    shutil.rmtree(os.path.join(temp_root, "a b"))
+    shutil.rmtree(os.path.join(temp_root, "a_b"))
+    print("Batch load passed.")
+
     # Test reload
     manager.reload()
     assert "subfolder1" in manager.subfolders, "Reload failed."